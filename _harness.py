@@ -0,0 +1,46 @@
+"""Shared setup for the test scripts.
+
+Every script runs its coroutine through `run`, so scripts driven from one process reuse a
+single event loop (uvloop when it is installed) instead of creating one per asyncio.run call,
+and prints each output section with `write_lines`.
+Importing this module also opts the scripts into the llms.txt disk cache, so repeated runs
+revalidate the stored copy instead of downloading it again.
+"""
+
+import asyncio
+import atexit
+import os
+import sys
+
+# Read when the parser's config is created, so this must run before that
+os.environ.setdefault("BLOG_CACHE_DIR", "~/.cache/my-tech-blog-mcp")
+
+
+def write_lines(lines: list[str]) -> None:
+    """Write one section of output with a single call instead of a print per line."""
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def _loop_factory():
+    """uvloop's loop factory when it is installed (it does not support Windows), else None."""
+    if sys.platform == "win32":
+        return None
+    try:
+        import uvloop
+    except ImportError:  # Optional: pip install uvloop
+        return None
+    return uvloop.new_event_loop
+
+
+if sys.version_info >= (3, 11):
+    runner = asyncio.Runner(loop_factory=_loop_factory())
+    atexit.register(runner.close)
+    run = runner.run
+else:
+    # asyncio.Runner is 3.11+; fall back to a fresh loop per call
+    runner = None
+    if _loop_factory() is not None:
+        import uvloop
+
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    run = asyncio.run
@@ -7,7 +7,8 @@ from pathlib import Path
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
-from server import mcp
+from server import install_uvloop, mcp
 
 if __name__ == "__main__":
+    install_uvloop()
     mcp.run()
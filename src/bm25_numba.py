@@ -0,0 +1,106 @@
+"""Numba-compiled BM25 scoring kernels.
+
+Optional backend for BM25SearchEngine, enabled via
+``BM25SearchEngine.activate_numba_scorer()``. Importing this module requires numba.
+"""
+
+from typing import Tuple
+
+import numba
+import numpy as np
+
+
+@numba.njit(cache=True, fastmath=True, nogil=True)
+def _score_jit(
+    query_term_ids, query_idfs, tf_indptr, tf_indices, tf_data, len_factor, k1, n_docs, out_scores
+):
+    """Scatter-add the BM25 contribution of every query term into out_scores."""
+    out_scores[:n_docs] = 0
+    for i in range(query_term_ids.shape[0]):
+        t = query_term_ids[i]
+        idf = query_idfs[i]
+        for j in range(tf_indptr[t], tf_indptr[t + 1]):
+            d = tf_indices[j]
+            tf = tf_data[j]
+            out_scores[d] += idf * tf * (k1 + 1) / (tf + len_factor[d])
+
+
+@numba.njit(cache=True, nogil=True)
+def _ranks_below(scores, a, b):
+    """Whether document a ranks below document b (ties go to the lower doc id)."""
+    return scores[a] < scores[b] or (scores[a] == scores[b] and a > b)
+
+
+@numba.njit(cache=True, nogil=True)
+def _sift_up(heap, pos, scores):
+    while pos > 0:
+        parent = (pos - 1) // 2
+        if not _ranks_below(scores, heap[pos], heap[parent]):
+            break
+        heap[pos], heap[parent] = heap[parent], heap[pos]
+        pos = parent
+
+
+@numba.njit(cache=True, nogil=True)
+def _sift_down(heap, size, pos, scores):
+    while True:
+        child = 2 * pos + 1
+        if child >= size:
+            break
+        if child + 1 < size and _ranks_below(scores, heap[child + 1], heap[child]):
+            child += 1
+        if not _ranks_below(scores, heap[child], heap[pos]):
+            break
+        heap[pos], heap[child] = heap[child], heap[pos]
+        pos = child
+
+
+@numba.njit(cache=True, nogil=True)
+def _topk_jit(scores, k):
+    """Indices of the k best positive scores, best first, using a bounded min-heap."""
+    heap = np.empty(k, dtype=np.int64)
+    size = 0
+    for d in range(scores.shape[0]):
+        if scores[d] <= 0:
+            continue
+        if size < k:
+            heap[size] = d
+            _sift_up(heap, size, scores)
+            size += 1
+        elif _ranks_below(scores, heap[0], d):
+            heap[0] = d
+            _sift_down(heap, size, 0, scores)
+
+    # Pop the worst document each time and fill the output from the back
+    out = np.empty(size, dtype=np.int64)
+    for i in range(size - 1, -1, -1):
+        out[i] = heap[0]
+        size -= 1
+        heap[0] = heap[size]
+        _sift_down(heap, size, 0, scores)
+    return out
+
+
+def score_topk(
+    query_term_ids: np.ndarray,
+    query_idfs: np.ndarray,
+    tf_indptr: np.ndarray,
+    tf_indices: np.ndarray,
+    tf_data: np.ndarray,
+    len_factor: np.ndarray,
+    k1: float,
+    top_k: int,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Score all documents and select the top-k.
+
+    len_factor holds the per-document denominator term k1 * (1 - b + b * dl / avgdl).
+
+    Returns:
+        Tuple of (top document indices sorted by score descending, all scores)
+    """
+    n_docs = len_factor.shape[0]
+    scores = np.empty(n_docs, dtype=np.float32)
+    _score_jit(
+        query_term_ids, query_idfs, tf_indptr, tf_indices, tf_data, len_factor, k1, n_docs, scores
+    )
+    return _topk_jit(scores, top_k), scores
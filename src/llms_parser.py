@@ -1,20 +1,85 @@
 """Parser for llms.txt content from jeongil.dev with advanced search capabilities."""
 
 import asyncio
+import bisect
+import io
+import json
 import logging
-import math
 import os
 import re
-from collections import Counter
+import threading
+import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
+from functools import lru_cache
+from typing import Callable, Dict, FrozenSet, Iterable, Iterator, List, Optional, Tuple
 
 import httpx
+import numpy as np
 from pydantic import BaseModel, Field
 
+try:
+    from mecab import MeCab  # python-mecab-ko (optional)
+except ImportError:
+    MeCab = None
+
+try:
+    import orjson
+except ImportError:  # Optional: pip install orjson
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Searchable terms: runs of word characters (Unicode \w already covers Korean syllables)
+_TOKEN_RE = re.compile(r"\w+")
+# Korean syllables, and word-character runs without them (used alongside MeCab)
+_HANGUL_RE = re.compile(r"[가-힣]")
+_NON_HANGUL_WORD_RE = re.compile(r"[^\W가-힣]+")
+
+# llms.txt parsing patterns
+_DATE_PUB_RE = re.compile(r"Published\s+(\d{4}-\d{2}-\d{2})")
+_DATE_RE = re.compile(r"(\d{4}-\d{2}-\d{2})")
+_MD_LINK_RE = re.compile(r"\[([^\]]+)\]\((/[^)]+)\)")
+_LIST_TITLE_RE = re.compile(r"- \[([^\]]+)\]")
+_REST_RE = re.compile(r"\):\s*(.+)")
+# Common post entry "- [title](/path): summary" in one match; a title without ")"
+# guarantees the same split as _LIST_TITLE_RE + _MD_LINK_RE + _REST_RE
+_LIST_ITEM_RE = re.compile(r"- \[([^\])]+)\]\((/[^)]+)\):\s*(.+)")
+# Line prefixes that start a heading or a post entry
+_STRUCTURE_PREFIXES = ("## ", "### ", "#### ", "- [")
+
+# "## " heading keyword -> main category, in priority order
+_CATEGORY_MAP = {
+    "Documentation": "documentation",
+    "Tech Blog": "tech_blog",
+    "Reflection": "reflections",
+    "Thoughts": "reflections",
+    "Trends": "trends",
+}
+
+# Extra category names a main category answers to (get_category_posts uses "reflection")
+_CATEGORY_ALIASES = {
+    "reflections": ("reflection",),
+}
+_NON_WORD_RE = re.compile(r"\W+")
+
+# Subcategory keyword -> subcategory, in priority order
+_SUBCATEGORY_KEYWORDS = {
+    "troubleshooting": "troubleshooting",
+    "performance": "performance",
+    "optimization": "performance",
+    "backend": "backend",
+    "infrastructure": "infrastructure",
+    "devops": "infrastructure",
+    "architecture": "architecture",
+    "design": "architecture",
+    "culture": "culture",
+    "reflection": "reflection",
+    "trends": "trends",
+}
+_SUBCATEGORY_RE = re.compile("|".join(map(re.escape, _SUBCATEGORY_KEYWORDS)))
+
 
 # =============================================================================
 # Configuration
@@ -46,9 +111,23 @@ class ParserConfig:
     base_url: str = field(default_factory=lambda: os.getenv("BLOG_BASE_URL", "https://jeongil.dev"))
     llms_path: str = field(default_factory=lambda: os.getenv("BLOG_LLMS_PATH", "/ko/llms.txt"))
     cache_ttl_minutes: int = field(default_factory=lambda: _safe_int("BLOG_CACHE_TTL_MINUTES", 60))
+    # Where the last llms.txt and its validators are kept across runs (None: disabled)
+    cache_dir: Optional[str] = field(
+        default_factory=lambda: os.path.expanduser(os.getenv("BLOG_CACHE_DIR", "")) or None
+    )
     http_timeout: float = field(default_factory=lambda: _safe_float("BLOG_HTTP_TIMEOUT", 30.0))
     http_max_retries: int = field(default_factory=lambda: _safe_int("BLOG_HTTP_MAX_RETRIES", 3))
     http_retry_delay: float = field(default_factory=lambda: _safe_float("BLOG_HTTP_RETRY_DELAY", 1.0))
+    http_max_connections: int = field(
+        default_factory=lambda: _safe_int("BLOG_HTTP_MAX_CONNECTIONS", 50)
+    )
+    http_max_keepalive_connections: int = field(
+        default_factory=lambda: _safe_int("BLOG_HTTP_MAX_KEEPALIVE_CONNECTIONS", 20)
+    )
+    search_backend: str = field(default_factory=lambda: os.getenv("BLOG_SEARCH_BACKEND", "numpy"))
+    search_cache_size: int = field(default_factory=lambda: _safe_int("BLOG_SEARCH_CACHE_SIZE", 256))
+    bm25_k1: float = field(default_factory=lambda: _safe_float("BLOG_BM25_K1", 1.5))
+    bm25_b: float = field(default_factory=lambda: _safe_float("BLOG_BM25_B", 0.75))
 
     @property
     def llms_url(self) -> str:
@@ -60,8 +139,18 @@ class ParserConfig:
 # =============================================================================
 
 
-class BlogSection(BaseModel):
-    """Represents a section in the blog with rich metadata."""
+# Main categories of llms.txt, in document order (also LLMSContent field names)
+CATEGORIES = ("documentation", "tech_blog", "reflections", "trends")
+
+
+@dataclass(slots=True, frozen=True)
+class BlogSection:
+    """Represents a section in the blog with rich metadata.
+
+    A slotted dataclass rather than a pydantic model: sections are only built
+    by the parser, so validation and per-instance __dict__ are pure overhead.
+    Frozen, since sections are shared by the search, date and title indices.
+    """
 
     title: str
     content: str  # Summary from llms.txt
@@ -70,7 +159,36 @@ class BlogSection(BaseModel):
     url: Optional[str] = None  # Human-readable URL (without .md)
     md_url: Optional[str] = None  # Direct URL to .md file for full content
     published_date: Optional[datetime] = None
-    tags: List[str] = Field(default_factory=list)
+    tags: Tuple[str, ...] = ()  # A tuple, so frozen sections stay immutable and hashable
+
+    # Derived fields; slots rule out cached_property, so they are filled eagerly
+    _title_lower: str = field(init=False, repr=False, compare=False)
+    _preview: str = field(init=False, repr=False, compare=False)  # Summary excerpt
+    _tokens: List[str] = field(init=False, repr=False, compare=False)  # full_text tokens
+    # Category names this section is listed under: main category, subcategory and aliases
+    _cat_tokens: FrozenSet[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Frozen instances can only be initialized through object.__setattr__
+        title_lower = self.title.lower()
+        object.__setattr__(self, "_title_lower", title_lower)
+        preview = self.content[:200].strip()
+        if len(self.content) > 200:
+            preview += "..."
+        object.__setattr__(self, "_preview", preview)
+        object.__setattr__(
+            self,
+            "_tokens",
+            BM25SearchEngine._tokenize_static(
+                f"{title_lower} {self.content.lower()}", lowered=True
+            ),
+        )
+        cat_tokens = set(
+            _NON_WORD_RE.split(f"{self.category} {self.subcategory or ''}".lower())
+        )
+        cat_tokens.update(_CATEGORY_ALIASES.get(self.category, ()))
+        cat_tokens.discard("")
+        object.__setattr__(self, "_cat_tokens", frozenset(cat_tokens))
 
     @property
     def full_text(self) -> str:
@@ -78,15 +196,15 @@ class BlogSection(BaseModel):
         return f"{self.title} {self.content}"
 
 
-class LLMSContent(BaseModel):
+@dataclass(slots=True, frozen=True)
+class LLMSContent:
     """Parsed content from llms.txt with metadata."""
 
-    raw_content: str
-    documentation: List[BlogSection] = Field(default_factory=list)
-    tech_blog: List[BlogSection] = Field(default_factory=list)
-    reflections: List[BlogSection] = Field(default_factory=list)
-    trends: List[BlogSection] = Field(default_factory=list)
-    fetched_at: datetime = Field(default_factory=datetime.now)
+    documentation: List[BlogSection] = field(default_factory=list)
+    tech_blog: List[BlogSection] = field(default_factory=list)
+    reflections: List[BlogSection] = field(default_factory=list)
+    trends: List[BlogSection] = field(default_factory=list)
+    fetched_at: datetime = field(default_factory=datetime.now)
     source_url: str = ""
 
     @property
@@ -108,11 +226,28 @@ class SearchResult(BaseModel):
 # =============================================================================
 
 
+_mecab_local = threading.local()
+
+
+def _get_mecab() -> Optional["MeCab"]:
+    """Get the MeCab-ko tagger for the current thread, or None if not installed."""
+    if MeCab is None:
+        return None
+    tagger = getattr(_mecab_local, "tagger", None)
+    if tagger is None:
+        tagger = _mecab_local.tagger = MeCab()
+    return tagger
+
+
 class BM25SearchEngine:
     """BM25 ranking algorithm implementation for text search.
 
     BM25 (Best Matching 25) is a ranking function used by search engines
     to estimate the relevance of documents to a given search query.
+
+    Term frequencies are stored column-wise (CSC layout: one posting list per
+    term) so a query only touches the documents that contain its terms, and
+    all per-document scores are computed with vectorized NumPy operations.
     """
 
     def __init__(self, k1: float = 1.5, b: float = 0.75):
@@ -123,78 +258,117 @@ class BM25SearchEngine:
         """
         self.k1 = k1
         self.b = b
-        self._documents: List[str] = []
-        self._doc_lengths: List[int] = []
+        self._n_docs = 0
+        self._doc_lengths = np.zeros(0, dtype=np.int32)
         self._avg_doc_length: float = 0
-        self._doc_freqs: Dict[str, int] = {}  # term -> number of docs containing term
-        self._term_freqs: List[Counter] = []  # per-document term frequencies
+        self._term_to_id: Dict[str, int] = {}
+        # CSC term-frequency matrix: postings of term t live in [indptr[t], indptr[t + 1])
+        self._tf_indptr = np.zeros(1, dtype=np.int64)
+        self._tf_indices = np.zeros(0, dtype=np.int32)  # document ids
+        self._tf_data = np.zeros(0, dtype=np.float32)  # term frequencies
+        self._idf = np.zeros(0, dtype=np.float32)  # term id -> IDF
+        # doc id -> k1 * (1 - b + b * dl / avgdl), the document-only part of the denominator
+        self._bm25_len_factor = np.zeros(0, dtype=np.float32)
+        self._numba_score_topk: Optional[Callable] = None
         self._indexed = False
 
-    def _tokenize(self, text: str) -> List[str]:
-        """Tokenize text into searchable terms."""
-        # Convert to lowercase and extract words
-        text = text.lower()
-        # Handle Korean and English
-        words = re.findall(r"[\w가-힣]+", text)
-        return words
-
-    def index(self, documents: List[str]) -> None:
-        """Build the search index from documents."""
-        self._documents = documents
-        self._term_freqs = []
-        self._doc_freqs = Counter()
-        self._doc_lengths = []
-
-        for doc in documents:
-            tokens = self._tokenize(doc)
-            self._doc_lengths.append(len(tokens))
-
-            term_freq = Counter(tokens)
-            self._term_freqs.append(term_freq)
-
-            # Update document frequencies (each term counted once per doc)
-            for term in set(tokens):
-                self._doc_freqs[term] += 1
-
-        self._avg_doc_length = sum(self._doc_lengths) / len(documents) if documents else 0
-        self._indexed = True
-        logger.debug(f"Indexed {len(documents)} documents with {len(self._doc_freqs)} unique terms")
+    def activate_numba_scorer(self) -> None:
+        """Use the numba-compiled kernels for scoring and top-k selection.
+
+        Raises:
+            ImportError: If numba is not installed
+        """
+        from bm25_numba import score_topk
+
+        self._numba_score_topk = score_topk
+        logger.info("Activated numba BM25 scorer")
+
+    @staticmethod
+    def _tokenize_static(text: str, lowered: bool = False) -> List[str]:
+        """Tokenize text into searchable terms.
+
+        Korean is agglutinative, so whitespace-delimited words glue stems to
+        particles and endings. When MeCab-ko is installed, Korean text is
+        reduced to its nouns; everything else keeps the regex word split.
+
+        Pass lowered=True when the text is already lowercase to skip that pass.
+        """
+        if not lowered:
+            text = text.lower()
+        tagger = _get_mecab()
+        if tagger is None or not _HANGUL_RE.search(text):
+            return _TOKEN_RE.findall(text)
+        return _NON_HANGUL_WORD_RE.findall(text) + tagger.nouns(text)
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _tokenize_query(query: str) -> Tuple[str, ...]:
+        """Tokenize a search query, memoized: the same query is tokenized once for all engines."""
+        return tuple(BM25SearchEngine._tokenize_static(query))
+
+    def index(self, documents: List[List[str]]) -> None:
+        """Build the search index from pre-tokenized documents."""
+        self._n_docs = n_docs = len(documents)
+        self._term_to_id = {}
+
+        # Map every token to an integer term id, laid out document after document
+        lengths = [len(tokens) for tokens in documents]
+        term_ids = np.fromiter(
+            (
+                self._term_to_id.setdefault(term, len(self._term_to_id))
+                for tokens in documents
+                for term in tokens
+            ),
+            dtype=np.int64,
+            count=sum(lengths),
+        )
+        doc_ids = np.repeat(np.arange(n_docs, dtype=np.int64), lengths)
+        n_terms = len(self._term_to_id)
+
+        # Count (term, doc) pairs; the sorted keys come out grouped by term with
+        # ascending doc ids, which is exactly the CSC layout
+        keys, tfs = np.unique(term_ids * max(n_docs, 1) + doc_ids, return_counts=True)
+        self._tf_indices = (keys % max(n_docs, 1)).astype(np.int32)
+        self._tf_data = tfs.astype(np.float32)
+        self._tf_indptr = np.zeros(n_terms + 1, dtype=np.int64)
+        np.cumsum(
+            np.bincount(keys // max(n_docs, 1), minlength=n_terms), out=self._tf_indptr[1:]
+        )
+
+        # BM25 IDF formula, precomputed once per term
+        df = np.diff(self._tf_indptr).astype(np.float64)
+        self._idf = np.log((n_docs - df + 0.5) / (df + 0.5) + 1).astype(np.float32)
 
-    def _idf(self, term: str) -> float:
-        """Calculate Inverse Document Frequency for a term."""
-        n = len(self._documents)
-        df = self._doc_freqs.get(term, 0)
-        if df == 0:
-            return 0
-        # BM25 IDF formula
-        return math.log((n - df + 0.5) / (df + 0.5) + 1)
+        self._doc_lengths = np.asarray(lengths, dtype=np.int32)
+        self._avg_doc_length = float(self._doc_lengths.mean()) if documents else 0
+        if self._avg_doc_length > 0:
+            len_norm = 1 - self.b + self.b * (self._doc_lengths / self._avg_doc_length)
+        else:
+            len_norm = np.ones(n_docs)  # No normalization if avg is 0
+        self._bm25_len_factor = (self.k1 * len_norm).astype(np.float32)
 
-    def _score_document(self, query_terms: List[str], doc_idx: int) -> Tuple[float, List[str]]:
-        """Calculate BM25 score for a single document."""
-        score = 0.0
-        matched_terms = []
+        self._indexed = True
+        logger.debug(f"Indexed {n_docs} documents with {n_terms} unique terms")
 
-        doc_length = self._doc_lengths[doc_idx]
-        term_freqs = self._term_freqs[doc_idx]
+    def _score(self, query_terms: List[str]) -> np.ndarray:
+        """Calculate BM25 scores of all documents for the query terms."""
+        scores = np.zeros(self._n_docs, dtype=np.float32)
 
         for term in query_terms:
-            if term not in term_freqs:
+            term_id = self._term_to_id.get(term)
+            if term_id is None:
                 continue
 
-            matched_terms.append(term)
-            tf = term_freqs[term]
-            idf = self._idf(term)
+            start, end = self._tf_indptr[term_id], self._tf_indptr[term_id + 1]
+            docs = self._tf_indices[start:end]
+            tf = self._tf_data[start:end]
 
-            # BM25 scoring formula (guard against division by zero)
-            numerator = tf * (self.k1 + 1)
-            if self._avg_doc_length > 0:
-                length_norm = doc_length / self._avg_doc_length
-            else:
-                length_norm = 1.0  # No normalization if avg is 0
-            denominator = tf + self.k1 * (1 - self.b + self.b * length_norm)
-            score += idf * (numerator / denominator)
+            # BM25 scoring formula, scatter-added over the term's postings
+            scores[docs] += (
+                self._idf[term_id] * tf * (self.k1 + 1) / (tf + self._bm25_len_factor[docs])
+            )
 
-        return score, matched_terms
+        return scores
 
     def search(self, query: str, top_k: int = 10) -> List[Tuple[int, float, List[str]]]:
         """
@@ -207,19 +381,61 @@ class BM25SearchEngine:
             logger.warning("Search called before indexing")
             return []
 
-        query_terms = self._tokenize(query)
+        query_terms = self._tokenize_query(query)
         if not query_terms:
             return []
 
-        results = []
-        for idx in range(len(self._documents)):
-            score, matched = self._score_document(query_terms, idx)
-            if score > 0:
-                results.append((idx, score, matched))
+        top_k = min(top_k, self._n_docs)
+        if top_k <= 0:
+            return []
 
-        # Sort by score descending
-        results.sort(key=lambda x: x[1], reverse=True)
-        return results[:top_k]
+        if self._numba_score_topk is not None:
+            term_ids = np.asarray(
+                [self._term_to_id[t] for t in query_terms if t in self._term_to_id],
+                dtype=np.int64,
+            )
+            top, scores = self._numba_score_topk(
+                term_ids,
+                self._idf[term_ids],
+                self._tf_indptr,
+                self._tf_indices,
+                self._tf_data,
+                self._bm25_len_factor,
+                self.k1,
+                top_k,
+            )
+        else:
+            scores = self._score(query_terms)
+            top = self._top_k(scores, top_k)
+
+        matched_terms = self._matched_terms(query_terms, top)
+        return [
+            (idx, float(scores[idx]), matched)
+            for idx, matched in zip(top.tolist(), matched_terms)
+        ]
+
+    @staticmethod
+    def _top_k(scores: np.ndarray, top_k: int) -> np.ndarray:
+        """Indices of the top-k matching documents, sorted by score descending."""
+        candidates = np.flatnonzero(scores)
+        if len(candidates) > top_k:
+            # Partition instead of sorting every match: O(M + k log k)
+            kth = candidates[np.argpartition(scores[candidates], -top_k)[-top_k:]]
+            # Keep every document tied with the k-th score so ties resolve by document order
+            candidates = candidates[scores[candidates] >= scores[kth].min()]
+        return candidates[np.lexsort((candidates, -scores[candidates]))][:top_k]
+
+    def _matched_terms(self, query_terms: List[str], doc_ids: np.ndarray) -> List[List[str]]:
+        """Query terms found in each of the given documents, in query order."""
+        matched: List[List[str]] = [[] for _ in range(len(doc_ids))]
+        for term in query_terms:
+            term_id = self._term_to_id.get(term)
+            if term_id is None:
+                continue
+            postings = self._tf_indices[self._tf_indptr[term_id] : self._tf_indptr[term_id + 1]]
+            for i in np.flatnonzero(np.isin(doc_ids, postings)).tolist():
+                matched[i].append(term)
+        return matched
 
 
 # =============================================================================
@@ -232,11 +448,34 @@ class CacheEntry:
     """Cache entry with expiration."""
 
     content: LLMSContent
-    expires_at: datetime
+    source: bytes  # The llms.txt text content was parsed from, UTF-8 encoded (compact)
+    expires_at: datetime  # Wall-clock expiry, for display
+    expires_at_monotonic: float  # Monotonic-clock expiry, for cheap expiry checks
+    etag: Optional[str] = None  # Validators for conditional refresh
+    last_modified: Optional[str] = None
+
+    @classmethod
+    def create(
+        cls,
+        content: LLMSContent,
+        source: bytes,
+        ttl_minutes: float,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> "CacheEntry":
+        ttl = timedelta(minutes=ttl_minutes)
+        return cls(
+            content=content,
+            source=source,
+            expires_at=datetime.now() + ttl,
+            expires_at_monotonic=time.monotonic() + ttl.total_seconds(),
+            etag=etag,
+            last_modified=last_modified,
+        )
 
     @property
     def is_expired(self) -> bool:
-        return datetime.now() > self.expires_at
+        return time.monotonic() >= self.expires_at_monotonic
 
 
 # =============================================================================
@@ -247,13 +486,78 @@ class CacheEntry:
 class ResilientHttpClient:
     """HTTP client with retry logic and circuit breaker pattern."""
 
-    def __init__(self, config: ParserConfig):
+    def __init__(self, config: ParserConfig, client: Optional[httpx.AsyncClient] = None):
+        """
+        Args:
+            config: Parser configuration (timeouts, retries, pool limits)
+            client: Externally owned client to send requests with; it is used
+                as-is and never closed here. Connection failures are only retried
+                by the owned pool's transport, so with an external client that is
+                the caller's job (e.g. httpx.AsyncHTTPTransport(retries=...));
+                the 5xx/429 backoff and the circuit breaker still apply
+        """
         self.config = config
         self._consecutive_failures = 0
         self._circuit_open_until: Optional[datetime] = None
+        self._external_client = client
+        # Created on first use so the pool binds to the loop that actually serves requests
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the pooled client, creating it for the running event loop.
+
+        One client serves all requests: keep-alive and HTTP/2 multiplexing
+        instead of a TCP+TLS handshake per fetch. Connection failures are
+        retried by the transport itself; get() only backs off on 5xx/429.
+        An external client is returned unchanged, without those transport retries.
+        """
+        if self._external_client is not None:
+            return self._external_client
+
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client_loop is not loop:
+            # A client from a previous (finished) loop cannot be reused or closed
+            transport = httpx.AsyncHTTPTransport(
+                http2=True,
+                limits=httpx.Limits(
+                    max_keepalive_connections=self.config.http_max_keepalive_connections,
+                    max_connections=self.config.http_max_connections,
+                ),
+                retries=max(self.config.http_max_retries - 1, 0),
+            )
+            self._client = httpx.AsyncClient(timeout=self.config.http_timeout, transport=transport)
+            self._client_loop = loop
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the owned connection pool; the next request opens a new one.
+
+        An externally supplied client is left open for its owner to close.
+        """
+        client, self._client, self._client_loop = self._client, None, None
+        if client is not None:
+            await client.aclose()
+
+    async def __aenter__(self) -> "ResilientHttpClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
 
     async def get(self, url: str) -> str:
-        """Fetch URL with retries and exponential backoff."""
+        """Fetch URL and return the response body."""
+        return (await self.get_response(url)).text
+
+    async def get_response(
+        self, url: str, headers: Optional[Dict[str, str]] = None
+    ) -> httpx.Response:
+        """Fetch URL, backing off exponentially on 5xx and 429 responses.
+
+        Connect failures are retried by the transport, so any other request
+        error is raised without further attempts. A 304 Not Modified answer
+        to a conditional request counts as success and is returned as-is.
+        """
         # Check circuit breaker
         if self._circuit_open_until and datetime.now() < self._circuit_open_until:
             raise ConnectionError(
@@ -262,19 +566,21 @@ class ResilientHttpClient:
             )
 
         last_exception: Optional[Exception] = None
+        attempts = 0
 
         for attempt in range(self.config.http_max_retries):
+            attempts = attempt + 1
             try:
-                async with httpx.AsyncClient(timeout=self.config.http_timeout) as client:
-                    response = await client.get(url)
+                response = await self._get_client().get(url, headers=headers)
+                if response.status_code != 304:
                     response.raise_for_status()
 
-                    # Reset failure count on success
-                    self._consecutive_failures = 0
-                    self._circuit_open_until = None
+                # Reset failure count on success
+                self._consecutive_failures = 0
+                self._circuit_open_until = None
 
-                    logger.info(f"Successfully fetched {url}")
-                    return response.text
+                logger.info(f"Successfully fetched {url} ({response.status_code})")
+                return response
 
             except httpx.HTTPStatusError as e:
                 last_exception = e
@@ -286,12 +592,11 @@ class ResilientHttpClient:
                 if 400 <= e.response.status_code < 500 and e.response.status_code != 429:
                     break
 
-            except (httpx.RequestError, httpx.TimeoutException) as e:
+            except httpx.RequestError as e:
                 last_exception = e
-                logger.warning(
-                    f"Request error fetching {url}: {e} "
-                    f"(attempt {attempt + 1}/{self.config.http_max_retries})"
-                )
+                logger.warning(f"Request error fetching {url}: {e}")
+                # Already retried at the connection layer by the transport
+                break
 
             # Exponential backoff
             if attempt < self.config.http_max_retries - 1:
@@ -306,9 +611,17 @@ class ResilientHttpClient:
             logger.error(f"Circuit breaker opened after {self._consecutive_failures} failures")
 
         raise ConnectionError(
-            f"Failed to fetch {url} after {self.config.http_max_retries} attempts: {last_exception}"
+            f"Failed to fetch {url} after {attempts} attempts: {last_exception}"
         )
 
+    async def get_many(self, urls: List[str]) -> List[str]:
+        """Fetch several URLs concurrently over the shared connection pool.
+
+        Returns:
+            Response bodies in the same order as urls
+        """
+        return await asyncio.gather(*(self.get(url) for url in urls))
+
 
 # =============================================================================
 # Main Parser
@@ -325,26 +638,166 @@ class LLMSParser:
     - Rich metadata extraction
     """
 
-    def __init__(self, config: Optional[ParserConfig] = None):
+    def __init__(
+        self, config: Optional[ParserConfig] = None, client: Optional[httpx.AsyncClient] = None
+    ):
+        """
+        Args:
+            config: Parser configuration; read from the environment when omitted
+            client: Shared httpx client to fetch with instead of the parser's own
+                pool; the caller keeps ownership and closes it, and configures its
+                connection retries (see ResilientHttpClient)
+        """
         self.config = config or ParserConfig()
         self._cache: Optional[CacheEntry] = None
-        self._http_client = ResilientHttpClient(self.config)
-        self._search_engine = BM25SearchEngine()
-        self._search_indexed = False
+        self._http_client = ResilientHttpClient(self.config, client=client)
+        # The in-flight refresh, shared by every caller that needs fresh content
+        self._refresh_task: Optional["asyncio.Task[LLMSContent]"] = None
+        # Whether fetches may revalidate the disk copy; off from invalidate() until a
+        # refresh has stored a fresh one
+        self._use_disk_cache = self.config.cache_dir is not None
+
+        self._use_numba = self.config.search_backend == "numba"
+        try:
+            self._new_search_engine()  # Probe the configured backend once
+        except ImportError:
+            logger.warning("numba is not installed, falling back to the NumPy BM25 scorer")
+            self._use_numba = False
+        # Search scope ("all" or a category) -> (engine, the sections it indexed); an
+        # engine's doc ids are positions in its own list, so the pair is replaced as a whole
+        self._search_indices: Dict[str, Tuple[BM25SearchEngine, List[BlogSection]]] = {}
+        # LRU cache of search results, keyed on (scope, normalized query, top_k)
+        self._query_cache: "OrderedDict[Tuple[str, str, int], List[SearchResult]]" = OrderedDict()
+        # Date index per category (None = all sections): dated sections in ascending
+        # date order, their dates for bisect, and the undated sections
+        self._by_date: Dict[Optional[str], List[BlogSection]] = {}
+        self._dates: Dict[Optional[str], List[datetime]] = {}
+        self._undated: Dict[Optional[str], List[BlogSection]] = {}
+        # Lowercased title -> first section with that exact title
+        self._title_index: Dict[str, BlogSection] = {}
+        # All lowercased titles joined by newlines (titles are single lines), with
+        # each title's start offset, so a substring lookup is one str.find
+        self._titles_joined = ""
+        self._title_starts: List[int] = []
+        self._title_sections: List[BlogSection] = []
+        # Rendered summaries/listings of the current content, reset when it is reparsed
+        self._render_cache: Dict[str, str] = {}
+        # Parse inputs -> section from the previous parse, so unchanged sections are
+        # reused on refresh instead of re-extracting metadata and re-tokenizing
+        self._sections_by_key: Dict[tuple, BlogSection] = {}
+        # Category name -> matching posts of the current content, filled per category on demand
+        self._category_posts: Dict[str, List[BlogSection]] = {}
+
+    def _new_search_engine(self) -> BM25SearchEngine:
+        """Create a BM25 engine using the configured scoring backend."""
+        engine = BM25SearchEngine(k1=self.config.bm25_k1, b=self.config.bm25_b)
+        if self._use_numba:
+            engine.activate_numba_scorer()
+        return engine
+
+    async def aclose(self) -> None:
+        """Close the HTTP connection pool."""
+        await self._http_client.aclose()
+
+    async def __aenter__(self) -> "LLMSParser":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
 
     async def fetch_content(self) -> str:
-        """Fetch llms.txt content from the blog with resilient HTTP."""
-        return await self._http_client.get(self.config.llms_url)
+        """Fetch llms.txt content from the blog with resilient HTTP.
+
+        The request is conditional on the cached source, or on the disk copy when
+        nothing is cached yet, and a 304 Not Modified returns that copy.
+        """
+        cached = self._cache
+        stored = None
+        if cached:
+            headers = self._conditional_headers(cached.etag, cached.last_modified)
+        else:
+            if self.config.cache_dir and self._use_disk_cache:
+                stored = await asyncio.to_thread(self._load_disk_cache)
+            headers = self._conditional_headers(stored[1], stored[2]) if stored else {}
+
+        response = await self._http_client.get_response(self.config.llms_url, headers)
+        if response.status_code == 304:
+            if cached:
+                return cached.source.decode("utf-8")
+            if stored:
+                return stored[0]
+        if self.config.cache_dir:
+            await asyncio.to_thread(self._save_disk_cache, response)
+        return response.text
+
+    @staticmethod
+    def _conditional_headers(etag: Optional[str], last_modified: Optional[str]) -> Dict[str, str]:
+        """Request headers that revalidate a copy with the given validators."""
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        return headers
+
+    def _disk_cache_paths(self) -> Tuple[str, str]:
+        """Paths of the stored llms.txt body and its JSON metadata sidecar."""
+        body_path = os.path.join(self.config.cache_dir, "llms.txt")
+        return body_path, f"{body_path}.json"
+
+    def _load_disk_cache(self) -> Optional[Tuple[str, Optional[str], Optional[str]]]:
+        """Read the stored llms.txt for the configured URL.
+
+        Returns:
+            Tuple of (body, etag, last_modified), or None without a usable copy
+        """
+        body_path, meta_path = self._disk_cache_paths()
+        try:
+            with open(meta_path, "rb") as f:
+                data = f.read()
+            meta = orjson.loads(data) if orjson else json.loads(data)
+            if meta.get("url") != self.config.llms_url:
+                return None
+            with open(body_path, "rb") as f:
+                body = f.read().decode("utf-8")
+        except (OSError, ValueError) as e:
+            logger.debug(f"No usable disk cache: {e}")
+            return None
+        etag, last_modified = meta.get("etag"), meta.get("last_modified")
+        if not (etag or last_modified):
+            return None
+        return body, etag, last_modified
+
+    def _save_disk_cache(self, response: httpx.Response) -> None:
+        """Store a 200 response body with its validators; failures are only logged."""
+        etag = response.headers.get("etag")
+        last_modified = response.headers.get("last-modified")
+        if response.status_code != 200 or not (etag or last_modified):
+            return
+        meta = {"url": self.config.llms_url, "etag": etag, "last_modified": last_modified}
+        body_path, meta_path = self._disk_cache_paths()
+        try:
+            os.makedirs(self.config.cache_dir, exist_ok=True)
+            # Body first, so metadata never describes a body that was not written
+            self._write_atomic(body_path, response.text.encode("utf-8"))
+            meta_bytes = orjson.dumps(meta) if orjson else json.dumps(meta).encode("utf-8")
+            self._write_atomic(meta_path, meta_bytes)
+        except OSError as e:
+            logger.warning(f"Failed to write disk cache: {e}")
+
+    @staticmethod
+    def _write_atomic(path: str, data: bytes) -> None:
+        """Write a file through a temporary name so readers never see a partial file."""
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
 
     def _extract_date(self, text: str) -> Optional[datetime]:
         """Extract publication date from text."""
         # Pattern: "Published YYYY-MM-DD" or "YYYY-MM-DD"
-        patterns = [
-            r"Published\s+(\d{4}-\d{2}-\d{2})",
-            r"(\d{4}-\d{2}-\d{2})",
-        ]
-        for pattern in patterns:
-            match = re.search(pattern, text)
+        for pattern in (_DATE_PUB_RE, _DATE_RE):
+            match = pattern.search(text)
             if match:
                 try:
                     return datetime.strptime(match.group(1), "%Y-%m-%d")
@@ -359,80 +812,113 @@ class LLMSParser:
             Tuple of (human_readable_url, md_url)
         """
         # Pattern: [text](/path/to/article.md)
-        match = re.search(r"\[([^\]]+)\]\((/[^)]+)\)", text)
+        match = _MD_LINK_RE.search(text)
         if match:
-            path = match.group(2)
-            md_url = f"{self.config.base_url}{path}"  # Full URL to .md file
+            return self._urls_from_path(match.group(2))
+        return None, None
 
-            # Convert .md path to human-readable URL
-            human_path = path
-            if human_path.endswith(".md"):
-                human_path = human_path.replace("/index.md", "").replace(".md", "")
-            human_url = f"{self.config.base_url}{human_path}"
+    def _urls_from_path(self, path: str) -> Tuple[str, str]:
+        """Build (human_readable_url, md_url) from a site-relative .md path."""
+        md_url = f"{self.config.base_url}{path}"  # Full URL to .md file
 
-            return human_url, md_url
-        return None, None
+        # Convert .md path to human-readable URL
+        human_path = path
+        if human_path.endswith(".md"):
+            human_path = human_path.replace("/index.md", "").replace(".md", "")
+        human_url = f"{self.config.base_url}{human_path}"
+
+        return human_url, md_url
 
     def _extract_subcategory(self, section_context: str) -> Optional[str]:
         """Extract subcategory from section context."""
-        subcategories = {
-            "troubleshooting": "troubleshooting",
-            "performance": "performance",
-            "optimization": "performance",
-            "backend": "backend",
-            "infrastructure": "infrastructure",
-            "devops": "infrastructure",
-            "architecture": "architecture",
-            "design": "architecture",
-            "culture": "culture",
-            "reflection": "reflection",
-            "trends": "trends",
-        }
-        context_lower = section_context.lower()
-        for keyword, subcat in subcategories.items():
-            if keyword in context_lower:
+        # One scan finds every keyword; the earliest keyword in priority order wins
+        keywords = {match.group(0) for match in _SUBCATEGORY_RE.finditer(section_context.lower())}
+        for keyword, subcat in _SUBCATEGORY_KEYWORDS.items():
+            if keyword in keywords:
                 return subcat
         return None
 
-    def _parse_sections(self, content: str) -> LLMSContent:
-        """Parse llms.txt content into structured sections with metadata."""
-        lines = content.split("\n")
+    @staticmethod
+    def _iter_lines(text: str) -> Iterator[str]:
+        """Yield the lines of text lazily, without building a list of all of them.
 
-        parsed = LLMSContent(
-            raw_content=content, source_url=self.config.llms_url, fetched_at=datetime.now()
-        )
+        Splits on "\n" and drops a trailing "\r", so LF and CRLF input both work.
+        """
+        pos = 0
+        end = len(text)
+        while pos < end:
+            nl = text.find("\n", pos)
+            if nl < 0:
+                nl = end
+            line = text[pos:nl]
+            yield line[:-1] if line.endswith("\r") else line
+            pos = nl + 1
+
+    def _parse_sections(self, lines: Iterable[str]) -> LLMSContent:
+        """Parse llms.txt lines into structured sections with metadata.
+
+        The source text is kept (as bytes) on the cache entry, not on the content.
+
+        Args:
+            lines: llms.txt content, line by line (any iterable, consumed once)
+        """
+        parsed = LLMSContent(source_url=self.config.llms_url, fetched_at=datetime.now())
 
         current_main_category: Optional[str] = None  # ## level
         current_sub_context: Optional[str] = None  # ### or #### level context
         current_section: Optional[str] = None
-        current_content: List[str] = []
+        current_content = io.StringIO()  # Section body, written as "line\n" per line
         current_url: Optional[str] = None
         current_md_url: Optional[str] = None
 
-        def save_section():
-            """Helper to save the current section."""
-            nonlocal current_content, current_section, current_url, current_md_url
+        def reset_content(first_line: Optional[str] = None):
+            """Helper to empty the section body buffer, optionally starting a new body."""
+            current_content.seek(0)
+            current_content.truncate()
+            if first_line is not None:
+                current_content.write(first_line)
+                current_content.write("\n")
 
-            if current_section and current_content and current_main_category:
-                content_text = "\n".join(current_content).strip()
+        previous_sections = self._sections_by_key
+        sections_by_key: Dict[tuple, BlogSection] = {}
 
-                # Extract metadata
-                pub_date = self._extract_date(content_text)
-                if not current_url:
-                    current_url, current_md_url = self._extract_url(content_text)
-                subcategory = self._extract_subcategory(
-                    f"{current_sub_context or ''} {current_section}"
-                )
-
-                section = BlogSection(
-                    title=current_section,
-                    content=content_text,
-                    category=current_main_category,
-                    subcategory=subcategory,
-                    url=current_url,
-                    md_url=current_md_url,
-                    published_date=pub_date,
+        def save_section():
+            """Helper to save the current section."""
+            nonlocal current_section, current_url, current_md_url
+
+            if current_section and current_content.tell() and current_main_category:
+                content_text = current_content.getvalue().strip()
+
+                # Everything the section is derived from; sections are immutable, so
+                # an unchanged entry can reuse the previous parse's instance
+                key = (
+                    current_main_category,
+                    current_sub_context,
+                    current_section,
+                    content_text,
+                    current_url,
+                    current_md_url,
                 )
+                section = previous_sections.get(key)
+                if section is None:
+                    # Extract metadata
+                    pub_date = self._extract_date(content_text)
+                    if not current_url:
+                        current_url, current_md_url = self._extract_url(content_text)
+                    subcategory = self._extract_subcategory(
+                        f"{current_sub_context or ''} {current_section}"
+                    )
+
+                    section = BlogSection(
+                        title=current_section,
+                        content=content_text,
+                        category=current_main_category,
+                        subcategory=subcategory,
+                        url=current_url,
+                        md_url=current_md_url,
+                        published_date=pub_date,
+                    )
+                sections_by_key[key] = section
 
                 # Add to appropriate list
                 if current_main_category == "documentation":
@@ -444,7 +930,7 @@ class LLMSParser:
                 elif current_main_category == "trends":
                     parsed.trends.append(section)
 
-                current_content = []
+                reset_content()
                 current_section = None
                 current_url = None
                 current_md_url = None
@@ -452,22 +938,22 @@ class LLMSParser:
         for line in lines:
             line_stripped = line.strip()
 
+            # Fast path: plain content lines skip the heading/list-item dispatch
+            if not line_stripped.startswith(_STRUCTURE_PREFIXES):
+                if current_main_category and current_section:
+                    current_content.write(line)
+                    current_content.write("\n")
+                continue
+
             # Detect ## level (main categories)
             if line_stripped.startswith("## "):
                 save_section()
 
                 section_title = line_stripped[3:].strip()
-
-                if "Documentation" in section_title:
-                    current_main_category = "documentation"
-                elif "Tech Blog" in section_title:
-                    current_main_category = "tech_blog"
-                elif "Reflection" in section_title or "Thoughts" in section_title:
-                    current_main_category = "reflections"
-                elif "Trends" in section_title:
-                    current_main_category = "trends"
-                else:
-                    current_main_category = None
+                current_main_category = next(
+                    (cat for keyword, cat in _CATEGORY_MAP.items() if keyword in section_title),
+                    None,
+                )
 
                 current_sub_context = None
 
@@ -485,28 +971,29 @@ class LLMSParser:
                 )
 
             # Detect list items with links (actual blog posts)
-            elif line_stripped.startswith("- ["):
+            else:
                 save_section()
 
+                # Fast path: title, link and summary in a single match
+                item_match = _LIST_ITEM_RE.match(line_stripped)
+                if item_match:
+                    current_section = item_match.group(1)
+                    current_url, current_md_url = self._urls_from_path(item_match.group(2))
+                    reset_content(item_match.group(3))
+                    continue
+
                 # Extract title from markdown link
-                title_match = re.match(r"- \[([^\]]+)\]", line_stripped)
+                title_match = _LIST_TITLE_RE.match(line_stripped)
                 if title_match:
                     current_section = title_match.group(1)
                     current_url, current_md_url = self._extract_url(line_stripped)
                     # Rest of the line is content start
-                    rest_match = re.search(r"\):\s*(.+)", line_stripped)
-                    if rest_match:
-                        current_content = [rest_match.group(1)]
-                    else:
-                        current_content = []
-
-            # Collect content
-            else:
-                if current_main_category and current_section:
-                    current_content.append(line)
+                    rest_match = _REST_RE.search(line_stripped)
+                    reset_content(rest_match.group(1) if rest_match else None)
 
         # Save last section
         save_section()
+        self._sections_by_key = sections_by_key
 
         logger.info(
             f"Parsed {len(parsed.documentation)} docs, "
@@ -517,34 +1004,180 @@ class LLMSParser:
 
         return parsed
 
-    def _build_search_index(self, content: LLMSContent) -> None:
-        """Build BM25 search index from content."""
-        all_sections = content.all_sections
-        documents = [section.full_text for section in all_sections]
-        self._search_engine.index(documents)
-        self._search_indexed = True
-        logger.info(f"Built search index with {len(documents)} documents")
+    def _build_search_index(
+        self, content: LLMSContent
+    ) -> Dict[str, Tuple[BM25SearchEngine, List[BlogSection]]]:
+        """Build fresh BM25 engines for content without touching the live ones.
+
+        Returns:
+            Search scope ("all" and each category) -> (engine, the sections it indexed),
+            installed by _install_search_index
+        """
+        search_indices = {}
+        scopes = [("all", content.all_sections)]
+        scopes += [(category, getattr(content, category)) for category in CATEGORIES]
+        for scope, sections in scopes:
+            engine = self._new_search_engine()
+            engine.index([section._tokens for section in sections])
+            search_indices[scope] = (engine, sections)
+
+        logger.info(f"Built search index with {len(search_indices['all'][1])} documents")
+        return search_indices
+
+    def _install_search_index(
+        self, search_indices: Dict[str, Tuple[BM25SearchEngine, List[BlogSection]]]
+    ) -> None:
+        """Swap in engines from _build_search_index and drop results of the old ones."""
+        self._search_indices = search_indices
+        self._query_cache.clear()
+
+    def _build_date_index(self, content: LLMSContent) -> tuple:
+        """Build per-category date-sorted section lists for range queries."""
+        by_date, dates, undated = {}, {}, {}
+        groups = [(None, content.all_sections)]
+        groups += [(category, getattr(content, category)) for category in CATEGORIES]
+
+        for key, sections in groups:
+            # Equal dates keep document order once the list is read newest-first
+            dated = sorted(
+                ((section.published_date, -pos, section) for pos, section in enumerate(sections)
+                 if section.published_date),
+                key=lambda entry: entry[:2],
+            )
+            by_date[key] = [section for _, _, section in dated]
+            dates[key] = [published_date for published_date, _, _ in dated]
+            undated[key] = [section for section in sections if not section.published_date]
+
+        return by_date, dates, undated
+
+    def _build_title_index(self, content: LLMSContent) -> tuple:
+        """Build the exact-title and joined-title lookups used by get_post_by_title."""
+        sections = content.all_sections
+        title_index: Dict[str, BlogSection] = {}
+        starts: List[int] = []
+        offset = 0
+        for section in sections:
+            title_index.setdefault(section._title_lower, section)
+            starts.append(offset)
+            offset += len(section._title_lower) + 1
+
+        titles_joined = "\n".join(section._title_lower for section in sections)
+        return title_index, titles_joined, starts, sections
+
+    def _parse_and_index(self, text: str) -> Tuple[LLMSContent, Dict, tuple, tuple]:
+        """Parse llms.txt and build its search, date and title indices.
+
+        CPU-bound; get_content runs it in a worker thread. Nothing live is
+        modified here: _refresh installs the indices together with the content.
+
+        Returns:
+            Tuple of (content, search index, date index, title index)
+        """
+        content = self._parse_sections(self._iter_lines(text))
+        return (
+            content,
+            self._build_search_index(content),
+            self._build_date_index(content),
+            self._build_title_index(content),
+        )
+
+    def invalidate(self) -> None:
+        """Drop the cached content so the next get_content fetches and parses it again.
+
+        Unlike force_refresh, the next fetch is unconditional (no ETag/Last-Modified):
+        the disk copy is not revalidated until that refresh has replaced it.
+        """
+        self._cache = None
+        self._use_disk_cache = False
 
     async def get_content(self, force_refresh: bool = False) -> LLMSContent:
-        """Get parsed llms.txt content with TTL caching."""
+        """Get parsed llms.txt content with TTL caching.
+
+        Once the cache expires (or on force_refresh) the document is re-requested
+        conditionally; a 304 Not Modified keeps the parsed content and indices
+        and only extends the expiry. Concurrent callers join a single in-flight
+        refresh task instead of each fetching the document.
+        """
         # Check cache
         if not force_refresh and self._cache and not self._cache.is_expired:
             logger.debug("Returning cached content")
             return self._cache.content
 
-        # Fetch and parse
+        loop = asyncio.get_running_loop()
+        task = self._refresh_task
+        if task is None or task.done() or task.get_loop() is not loop:
+            task = self._refresh_task = loop.create_task(self._refresh())
+            # Mark the outcome as retrieved even if every waiter was cancelled
+            task.add_done_callback(lambda t: t.cancelled() or t.exception())
+
+        # Shielded: a cancelled caller must not abort the refresh other callers await
+        return await asyncio.shield(task)
+
+    async def get_source_text(self) -> str:
+        """Get the llms.txt text the current content was parsed from.
+
+        Served from the cache entry, so it shares get_content's TTL caching,
+        conditional refresh and stale fallback instead of downloading the file.
+        """
+        await self.get_content()
+        return self._cache.source.decode("utf-8")
+
+    async def _refresh(self) -> LLMSContent:
+        """Fetch, parse and index llms.txt; runs as the shared refresh task."""
         try:
-            raw_content = await self.fetch_content()
-            content = self._parse_sections(raw_content)
+            cached = self._cache
+            stored = None
+            if cached:
+                headers = self._conditional_headers(cached.etag, cached.last_modified)
+            else:
+                # Nothing parsed yet: revalidate the copy from a previous run instead
+                if self._use_disk_cache:
+                    stored = await asyncio.to_thread(self._load_disk_cache)
+                headers = self._conditional_headers(stored[1], stored[2]) if stored else {}
+
+            response = await self._http_client.get_response(self.config.llms_url, headers)
+            if cached and response.status_code == 304:
+                logger.info("llms.txt not modified, keeping cached content")
+                self._cache = CacheEntry.create(
+                    cached.content,
+                    cached.source,
+                    self.config.cache_ttl_minutes,
+                    etag=response.headers.get("etag", cached.etag),
+                    last_modified=response.headers.get("last-modified", cached.last_modified),
+                )
+                return cached.content
 
-            # Update cache
-            self._cache = CacheEntry(
-                content=content,
-                expires_at=datetime.now() + timedelta(minutes=self.config.cache_ttl_minutes),
+            if stored and response.status_code == 304:
+                logger.info("llms.txt not modified, using the disk cache")
+                text, etag, last_modified = stored
+            else:
+                if self.config.cache_dir:
+                    await asyncio.to_thread(self._save_disk_cache, response)
+                    self._use_disk_cache = True
+                text, etag, last_modified = response.text, None, None
+
+            # Parse and index off the event loop
+            content, search_indices, date_index, title_index = await asyncio.to_thread(
+                self._parse_and_index, text
             )
 
-            # Rebuild search index
-            self._build_search_index(content)
+            # Install the indices and the content they describe in one step on the loop
+            # (no await in between), so no search pairs one refresh's content with
+            # another's doc ids
+            self._install_search_index(search_indices)
+            self._by_date, self._dates, self._undated = date_index
+            self._title_index, self._titles_joined, self._title_starts, self._title_sections = (
+                title_index
+            )
+            self._cache = CacheEntry.create(
+                content,
+                text.encode("utf-8"),
+                self.config.cache_ttl_minutes,
+                etag=response.headers.get("etag", etag),
+                last_modified=response.headers.get("last-modified", last_modified),
+            )
+            self._render_cache = {}
+            self._category_posts = {}
 
             return content
 
@@ -556,34 +1189,137 @@ class LLMSParser:
                 return self._cache.content
             raise
 
+    def _get_cached_search(self, key: Tuple[str, str, int]) -> Optional[List[SearchResult]]:
+        """Look up cached search results, marking them as recently used."""
+        results = self._query_cache.get(key)
+        if results is None:
+            return None
+        self._query_cache.move_to_end(key)
+        return list(results)
+
+    def _cache_search(self, key: Tuple[str, str, int], results: List[SearchResult]) -> None:
+        """Store search results, evicting the least recently used entry when full."""
+        if self.config.search_cache_size <= 0:
+            return
+        self._query_cache[key] = list(results)
+        if len(self._query_cache) > self.config.search_cache_size:
+            self._query_cache.popitem(last=False)
+
     async def search_all(self, query: str, top_k: int = 10) -> List[SearchResult]:
         """Search across all sections using BM25 ranking."""
+        return await self.search_category("all", query, top_k)
+
+    async def _get_search_index(self, scope: str) -> Tuple[BM25SearchEngine, List[BlogSection]]:
+        """The engine for a search scope with the sections its doc ids refer to."""
         content = await self.get_content()
 
-        if not self._search_indexed:
-            self._build_search_index(content)
+        if not self._search_indices:
+            self._install_search_index(self._build_search_index(content))
+        return self._search_indices[scope]
 
-        all_sections = content.all_sections
-        results = self._search_engine.search(query, top_k)
+    async def search_batch(
+        self, queries: List[str], top_k: int = 10
+    ) -> List[List[SearchResult]]:
+        """Search across all sections for several queries at once.
 
-        return [
-            SearchResult(section=all_sections[idx], score=score, matched_terms=matched)
-            for idx, score, matched in results
+        Uncached queries are scored in parallel worker threads; NumPy and the
+        numba kernels release the GIL while scoring.
+
+        Returns:
+            One result list per query, in the same order as queries
+        """
+        engine, all_sections = await self._get_search_index("all")
+        search_indices = self._search_indices
+        cache_keys = [("all", query.strip().lower(), top_k) for query in queries]
+        batch: List[Optional[List[SearchResult]]] = [
+            self._get_cached_search(key) for key in cache_keys
+        ]
+
+        misses = [i for i, results in enumerate(batch) if results is None]
+        scored = await asyncio.gather(
+            *(asyncio.to_thread(engine.search, queries[i], top_k) for i in misses)
+        )
+        for i, results in zip(misses, scored):
+            batch[i] = [
+                SearchResult(section=all_sections[idx], score=score, matched_terms=matched)
+                for idx, score, matched in results
+            ]
+            # A refresh during scoring replaced the index; don't cache results of the old one
+            if self._search_indices is search_indices:
+                self._cache_search(cache_keys[i], batch[i])
+
+        return batch
+
+    async def search_category(
+        self, category: str, query: str, top_k: int = 10
+    ) -> List[SearchResult]:
+        """Search within a single main category (or "all") using its own BM25 index."""
+        engine, sections = await self._get_search_index(category)
+
+        cache_key = (category, query.strip().lower(), top_k)
+        cached = self._get_cached_search(cache_key)
+        if cached is not None:
+            return cached
+
+        results = [
+            SearchResult(section=sections[idx], score=score, matched_terms=matched)
+            for idx, score, matched in engine.search(query, top_k)
         ]
+        self._cache_search(cache_key, results)
+        return results
 
     async def search_documentation(self, query: str, top_k: int = 10) -> List[BlogSection]:
         """Search for content in documentation sections."""
-        results = await self.search_all(query, top_k=50)  # Get more, then filter
-
-        filtered = [r.section for r in results if r.section.category == "documentation"]
-        return filtered[:top_k]
+        results = await self.search_category("documentation", query, top_k)
+        return [r.section for r in results]
 
     async def search_tech_blog(self, query: str, top_k: int = 10) -> List[BlogSection]:
         """Search for content in tech blog sections."""
-        results = await self.search_all(query, top_k=50)
+        results = await self.search_category("tech_blog", query, top_k)
+        return [r.section for r in results]
+
+    def _get_rendered(self, key: str, render: Callable[[], str]) -> str:
+        """Return a rendered text for the current content, rendering it on first use."""
+        text = self._render_cache.get(key)
+        if text is None:
+            text = self._render_cache[key] = render()
+        return text
+
+    @staticmethod
+    def _render_listing(sections: List[BlogSection]) -> str:
+        """Render sections in full, separated by horizontal rules.
+
+        Written section by section into one buffer, without a list of
+        per-section strings to join.
+        """
+        buf = io.StringIO()
+        for idx, section in enumerate(sections):
+            if idx:
+                buf.write("\n---\n\n")
+            buf.write(f"# {section.title}\n\n")
+            buf.write(section.content)
+            buf.write("\n")
+        return buf.getvalue()
+
+    async def get_documentation_listing(self) -> str:
+        """Get the full text of all documentation sections."""
+        content = await self.get_content()
+
+        if not content.documentation:
+            return "No documentation sections available."
+
+        return self._get_rendered(
+            "documentation", lambda: self._render_listing(content.documentation)
+        )
+
+    async def get_tech_blog_listing(self) -> str:
+        """Get the full text of all tech blog sections."""
+        content = await self.get_content()
+
+        if not content.tech_blog:
+            return "No tech blog posts available."
 
-        filtered = [r.section for r in results if r.section.category == "tech_blog"]
-        return filtered[:top_k]
+        return self._get_rendered("tech_blog", lambda: self._render_listing(content.tech_blog))
 
     async def get_documentation_summary(self) -> str:
         """Get a summary of all documentation sections."""
@@ -592,18 +1328,23 @@ class LLMSParser:
         if not content.documentation:
             return "No documentation sections found."
 
-        summary_parts = ["# Documentation Summary\n"]
+        return self._get_rendered(
+            "documentation_summary", lambda: self._render_documentation_summary(content)
+        )
+
+    @staticmethod
+    def _render_documentation_summary(content: LLMSContent) -> str:
+        """Render the documentation summary: title, URL and a short preview per section."""
+        buf = io.StringIO()
+        buf.write("# Documentation Summary\n")
         for section in content.documentation:
-            summary_parts.append(f"## {section.title}")
+            buf.write(f"\n## {section.title}\n")
             if section.url:
-                summary_parts.append(f"URL: {section.url}")
-            preview = section.content[:200].strip()
-            if len(section.content) > 200:
-                preview += "..."
-            summary_parts.append(preview)
-            summary_parts.append("")
+                buf.write(f"URL: {section.url}\n")
+            buf.write(section._preview)
+            buf.write("\n")
 
-        return "\n".join(summary_parts)
+        return buf.getvalue()
 
     async def get_tech_blog_summary(self) -> str:
         """Get a summary of all tech blog sections."""
@@ -612,9 +1353,17 @@ class LLMSParser:
         if not content.tech_blog:
             return "No tech blog sections found."
 
-        summary_parts = ["# Tech Blog Summary\n"]
+        return self._get_rendered(
+            "tech_blog_summary", lambda: self._render_tech_blog_summary(content)
+        )
+
+    @staticmethod
+    def _render_tech_blog_summary(content: LLMSContent) -> str:
+        """Render the tech blog summary: title, metadata and a short preview per post."""
+        buf = io.StringIO()
+        buf.write("# Tech Blog Summary\n")
         for section in content.tech_blog:
-            summary_parts.append(f"## {section.title}")
+            buf.write(f"\n## {section.title}\n")
             meta_parts = []
             if section.published_date:
                 meta_parts.append(f"Published: {section.published_date.strftime('%Y-%m-%d')}")
@@ -623,14 +1372,32 @@ class LLMSParser:
             if section.url:
                 meta_parts.append(f"URL: {section.url}")
             if meta_parts:
-                summary_parts.append(" | ".join(meta_parts))
-            preview = section.content[:200].strip()
-            if len(section.content) > 200:
-                preview += "..."
-            summary_parts.append(preview)
-            summary_parts.append("")
+                buf.write(" | ".join(meta_parts))
+                buf.write("\n")
+            buf.write(section._preview)
+            buf.write("\n")
+
+        return buf.getvalue()
+
+    async def get_category_posts(self, category: str) -> List[BlogSection]:
+        """Get posts listed under a category name (main category, subcategory or alias).
+
+        The matching posts are computed once per category and reused until the
+        content is reparsed.
+
+        Returns:
+            Matching posts in document order
+        """
+        content = await self.get_content()
 
-        return "\n".join(summary_parts)
+        posts = self._category_posts.get(category)
+        if posts is None:
+            posts = self._category_posts[category] = [
+                section
+                for section in content.all_sections
+                if category in section._cat_tokens
+            ]
+        return posts
 
     async def get_posts_by_date(
         self,
@@ -638,32 +1405,25 @@ class LLMSParser:
         end_date: Optional[datetime] = None,
         category: Optional[str] = None,
     ) -> List[BlogSection]:
-        """Get posts filtered by date range and optionally category."""
-        content = await self.get_content()
+        """Get posts filtered by date range and optionally category.
 
-        sections = (
-            content.all_sections
-            if not category
-            else [s for s in content.all_sections if s.category == category]
-        )
+        Returns:
+            Matching posts sorted by date descending
+        """
+        await self.get_content()
 
-        # Filter by date (only include posts WITH dates when date filtering is requested)
-        filtered = []
-        for section in sections:
-            # If date filters are specified, only include posts with dates
-            if start_date or end_date:
-                if not section.published_date:
-                    continue  # Skip posts without dates when filtering by date
-                if start_date and section.published_date < start_date:
-                    continue
-                if end_date and section.published_date > end_date:
-                    continue
-            filtered.append(section)
+        key = category or None
+        dated = self._by_date.get(key, [])
 
-        # Sort by date descending
-        filtered.sort(key=lambda s: s.published_date or datetime.min, reverse=True)
+        # Only include posts WITH dates when date filtering is requested
+        if start_date or end_date:
+            dates = self._dates[key] if dated else []
+            lo = bisect.bisect_left(dates, start_date) if start_date else 0
+            hi = bisect.bisect_right(dates, end_date) if end_date else len(dates)
+            return dated[lo:hi][::-1]
 
-        return filtered
+        # Without a date filter, undated posts come last
+        return dated[::-1] + self._undated.get(key, [])
 
     async def get_health_status(self) -> Dict:
         """Get health status of the parser."""
@@ -671,12 +1431,15 @@ class LLMSParser:
             "status": "healthy",
             "cache_valid": self._cache is not None and not self._cache.is_expired,
             "cache_expires_at": self._cache.expires_at.isoformat() if self._cache else None,
-            "search_indexed": self._search_indexed,
+            "search_indexed": bool(self._search_indices),
             "source_url": self.config.llms_url,
             "config": {
                 "cache_ttl_minutes": self.config.cache_ttl_minutes,
                 "http_timeout": self.config.http_timeout,
                 "http_max_retries": self.config.http_max_retries,
+                # The backend in use: numba falls back to numpy when it is not installed
+                "search_backend": "numba" if self._use_numba else "numpy",
+                "search_cache_entries": len(self._query_cache),
             },
         }
 
@@ -695,6 +1458,22 @@ class LLMSParser:
         logger.info(f"Fetching full content from: {section.md_url}")
         return await self._http_client.get(section.md_url)
 
+    async def fetch_posts_content(self, sections: List[BlogSection]) -> List[str]:
+        """Fetch full content of several blog posts concurrently.
+
+        Args:
+            sections: BlogSections with md_url
+
+        Returns:
+            Full markdown content of each post, in the same order as sections
+        """
+        missing = [section.title for section in sections if not section.md_url]
+        if missing:
+            raise ValueError(f"No md_url available for sections: {', '.join(missing)}")
+
+        logger.info(f"Fetching full content of {len(sections)} posts")
+        return await self._http_client.get_many([section.md_url for section in sections])
+
     async def get_post_by_title(self, title: str) -> Optional[BlogSection]:
         """Find a post by its title (partial match supported).
 
@@ -704,14 +1483,23 @@ class LLMSParser:
         Returns:
             Matching BlogSection or None
         """
-        content = await self.get_content()
+        await self.get_content()
         title_lower = title.lower()
 
-        for section in content.all_sections:
-            if title_lower in section.title.lower():
-                return section
+        # Exact title match first, then fall back to a substring search
+        hit = self._title_index.get(title_lower)
+        if hit is not None:
+            return hit
 
-        return None
+        # A query containing the separator could match across two titles
+        if not self._title_sections or "\n" in title_lower:
+            return None
+
+        # The first occurrence in the joined titles is the first matching section
+        pos = self._titles_joined.find(title_lower)
+        if pos < 0:
+            return None
+        return self._title_sections[bisect.bisect_right(self._title_starts, pos) - 1]
 
     async def get_full_post_content(self, title: str) -> Optional[str]:
         """Get full content of a post by title.
@@ -734,3 +1522,15 @@ class LLMSParser:
         except Exception as e:
             logger.error(f"Failed to fetch full content for {section.title}: {e}")
             return f"# {section.title}\n\n{section.content}\n\n(Failed to fetch full content: {e})"
+
+
+# Parser configured from the environment, shared by the MCP server and the test scripts
+_default_parser: Optional[LLMSParser] = None
+
+
+def get_default_parser() -> LLMSParser:
+    """Return the shared parser, creating it on first use so importing this module is free."""
+    global _default_parser
+    if _default_parser is None:
+        _default_parser = LLMSParser()
+    return _default_parser
@@ -3,14 +3,22 @@
 Built with FastMCP for the fastest, most Pythonic MCP server development.
 """
 
+import asyncio
 import json
 import logging
+import sys
+from contextlib import asynccontextmanager
 from datetime import datetime, timedelta
-from typing import Literal, Optional
+from typing import AsyncIterator, Literal, Optional
 
 from fastmcp import FastMCP
 
-from llms_parser import LLMSParser, ParserConfig
+from llms_parser import get_default_parser
+
+try:
+    import orjson
+except ImportError:  # Optional: pip install orjson
+    orjson = None
 
 # Configure logging
 logging.basicConfig(
@@ -18,12 +26,34 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Initialize FastMCP server
-mcp = FastMCP("My Tech Blog")
+# Share the module-level parser, so scripts that import it reuse the loaded content
+parser = get_default_parser()
+config = parser.config
+
+
+def install_uvloop() -> None:
+    """Run the server on uvloop when it is installed (it does not support Windows)."""
+    if sys.platform == "win32":
+        return
+    try:
+        import uvloop
+    except ImportError:  # Optional: pip install uvloop
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    logger.info("Using uvloop event loop")
 
-# Initialize parser with config
-config = ParserConfig()
-parser = LLMSParser(config=config)
+
+@asynccontextmanager
+async def lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Close the parser's HTTP connection pool when the server shuts down."""
+    try:
+        yield
+    finally:
+        await parser.aclose()
+
+
+# Initialize FastMCP server
+mcp = FastMCP("My Tech Blog", lifespan=lifespan)
 
 logger.info(f"Initialized parser with URL: {config.llms_url}")
 
@@ -40,8 +70,7 @@ async def get_full_llms_txt() -> str:
     Includes all documentation, tech blog posts, and experiences
     from the personal development blog.
     """
-    content = await parser.get_content()
-    return content.raw_content
+    return await parser.get_source_text()
 
 
 @mcp.resource("blog://documentation")
@@ -51,15 +80,7 @@ async def get_documentation() -> str:
     Contains coding conventions, Git workflows, architecture principles,
     API design patterns, testing strategies, and infrastructure rules.
     """
-    content = await parser.get_content()
-
-    if not content.documentation:
-        return "No documentation sections available."
-
-    sections = []
-    for section in content.documentation:
-        sections.append(f"# {section.title}\n\n{section.content}\n")
-    return "\n---\n\n".join(sections)
+    return await parser.get_documentation_listing()
 
 
 @mcp.resource("blog://tech-blog")
@@ -69,15 +90,7 @@ async def get_tech_blog() -> str:
     Contains experiences in Backend development, Infrastructure & DevOps,
     Architecture & Design, and Development Culture.
     """
-    content = await parser.get_content()
-
-    if not content.tech_blog:
-        return "No tech blog posts available."
-
-    sections = []
-    for section in content.tech_blog:
-        sections.append(f"# {section.title}\n\n{section.content}\n")
-    return "\n---\n\n".join(sections)
+    return await parser.get_tech_blog_listing()
 
 
 @mcp.resource("blog://documentation/summary")
@@ -185,13 +198,7 @@ async def get_category_posts(
     Returns:
         All posts from the specified category with metadata
     """
-    content = await parser.get_content()
-
-    filtered_sections = [
-        section
-        for section in content.all_sections
-        if section.subcategory == category or category in (section.category or "").lower()
-    ]
+    filtered_sections = await parser.get_category_posts(category)
 
     if not filtered_sections:
         return f"No posts found in category: '{category}'"
@@ -380,6 +387,8 @@ async def health_check() -> str:
         JSON health status including cache state and configuration
     """
     status = await parser.get_health_status()
+    if orjson is not None:
+        return orjson.dumps(status, option=orjson.OPT_INDENT_2, default=str).decode()
     return json.dumps(status, indent=2, default=str)
 
 
@@ -505,4 +514,5 @@ if __name__ == "__main__":
     logger.info("Starting My Tech Blog MCP Server...")
     logger.info(f"Serving content from: {config.llms_url}")
     logger.info(f"Cache TTL: {config.cache_ttl_minutes} minutes")
+    install_uvloop()
     mcp.run()
@@ -3,84 +3,106 @@
 
 import asyncio
 import sys
+import traceback
 from pathlib import Path
 
+from _harness import run, write_lines
+
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
-from llms_parser import LLMSParser
+from llms_parser import LLMSParser, get_default_parser
+
+SEPARATOR = "=" * 60
+HEADER = f"{SEPARATOR}\nMy Tech Blog MCP Server - Connection Test\n{SEPARATOR}\n\n"
 
 
 async def test_connection():
     """Test connection to jeongil.dev and parsing."""
-    print("=" * 60)
-    print("My Tech Blog MCP Server - Connection Test")
-    print("=" * 60)
-    print()
+    sys.stdout.write(HEADER)
+
+    # The shared parser and its pooled client serve every request in the test, so the TLS
+    # handshake is paid once; leaving the block closes the pool
+    async with get_default_parser() as parser:
+        await run_checks(parser)
 
-    parser = LLMSParser()
 
+async def run_checks(parser: LLMSParser):
+    """Run the connection, parsing and search checks with the given parser."""
     try:
-        # Test 1: Fetch content
-        print("1. llms.txt 콘텐츠 가져오기...")
-        raw_content = await parser.fetch_content()
-        print(f"   ✓ 성공: {len(raw_content)} 문자 수신")
-        print()
+        # The search (test 5) starts now and shares the parse below instead of waiting for it
+        search_task = asyncio.create_task(parser.search_documentation("git"))
 
-        # Test 2: Parse content
-        print("2. 콘텐츠 파싱...")
+        # Test 1 & 2: Fetch and parse content (one request, shared with the search above);
+        # the raw text then comes from the parser's cache
+        print("1. llms.txt 콘텐츠 가져오기...")
         content = await parser.get_content()
-        print(f"   ✓ Documentation 섹션: {len(content.documentation)}개")
-        print(f"   ✓ Tech Blog 섹션: {len(content.tech_blog)}개")
-        print(f"   ✓ Reflections 섹션: {len(content.reflections)}개")
-        print(f"   ✓ Trends 섹션: {len(content.trends)}개")
-        print()
+        raw_content = await parser.get_source_text()
+        write_lines(
+            [
+                f"   ✓ 성공: {len(raw_content)} 문자 수신",
+                "",
+                "2. 콘텐츠 파싱...",
+                f"   ✓ Documentation 섹션: {len(content.documentation)}개",
+                f"   ✓ Tech Blog 섹션: {len(content.tech_blog)}개",
+                f"   ✓ Reflections 섹션: {len(content.reflections)}개",
+                f"   ✓ Trends 섹션: {len(content.trends)}개",
+                "",
+            ]
+        )
 
         # Test 3: Show documentation sections
         if content.documentation:
-            print("3. Documentation 섹션 목록:")
+            lines = ["3. Documentation 섹션 목록:"]
             for i, section in enumerate(content.documentation[:5], 1):
-                print(f"   {i}. {section.title}")
+                lines.append(f"   {i}. {section.title}")
             if len(content.documentation) > 5:
-                print(f"   ... 외 {len(content.documentation) - 5}개")
-            print()
+                lines.append(f"   ... 외 {len(content.documentation) - 5}개")
+            lines.append("")
+            write_lines(lines)
 
         # Test 4: Show tech blog sections
         if content.tech_blog:
-            print("4. Tech Blog 섹션 목록:")
+            lines = ["4. Tech Blog 섹션 목록:"]
             for i, section in enumerate(content.tech_blog[:5], 1):
-                print(f"   {i}. {section.title}")
+                lines.append(f"   {i}. {section.title}")
             if len(content.tech_blog) > 5:
-                print(f"   ... 외 {len(content.tech_blog) - 5}개")
-            print()
+                lines.append(f"   ... 외 {len(content.tech_blog) - 5}개")
+            lines.append("")
+            write_lines(lines)
 
         # Test 5: Search test
         print("5. 검색 기능 테스트 (query: 'git')...")
-        results = await parser.search_documentation("git")
-        print(f"   ✓ {len(results)}개의 결과 발견")
+        results = await search_task
+        lines = [f"   ✓ {len(results)}개의 결과 발견"]
         if results:
-            print(f"   첫 번째 결과: {results[0].title}")
-        print()
+            lines.append(f"   첫 번째 결과: {results[0].title}")
+        lines.append("")
+        write_lines(lines)
 
-        print("=" * 60)
-        print("✓ 모든 테스트 통과!")
-        print("=" * 60)
-        print()
-        print("MCP 서버가 정상적으로 작동할 준비가 되었습니다.")
-        print("Claude Desktop에서 사용할 수 있습니다.")
-        print()
+        write_lines(
+            [
+                SEPARATOR,
+                "✓ 모든 테스트 통과!",
+                SEPARATOR,
+                "",
+                "MCP 서버가 정상적으로 작동할 준비가 되었습니다.",
+                "Claude Desktop에서 사용할 수 있습니다.",
+                "",
+            ]
+        )
+        sys.stdout.flush()
 
     except Exception as e:
         print()
-        print("=" * 60)
+        print(SEPARATOR)
         print("✗ 테스트 실패")
-        print("=" * 60)
+        print(SEPARATOR)
         print(f"오류: {e}")
         print()
-        import traceback
-        traceback.print_exc()
+        traceback.print_exception(type(e), e, e.__traceback__, limit=5)
         sys.exit(1)
 
 
 if __name__ == "__main__":
-    asyncio.run(test_connection())
+    run(test_connection())
@@ -2,28 +2,19 @@
 """Test FastMCP server components."""
 
 import sys
+import traceback
 from pathlib import Path
 
-# Add src to path and change directory context
-src_path = Path(__file__).parent / "src"
-sys.path.insert(0, str(src_path))
+from _harness import write_lines
 
-# Import with proper module resolution
-import importlib.util
-spec = importlib.util.spec_from_file_location("server", src_path / "server.py")
-server_module = importlib.util.module_from_spec(spec)
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
 
-# Create a mock llms_parser module to avoid import issues
-import types
-llms_parser = types.ModuleType("llms_parser")
-sys.modules["server.llms_parser"] = llms_parser
+SEPARATOR = "=" * 80
+HEADER = f"{SEPARATOR}\nFastMCP Server - Import Test\n{SEPARATOR}\n\n"
 
-# Now try to load the server
 try:
-    print("=" * 80)
-    print("FastMCP Server - Import Test")
-    print("=" * 80)
-    print()
+    sys.stdout.write(HEADER)
 
     # Try importing directly
     from llms_parser import LLMSParser
@@ -33,16 +24,19 @@ try:
     from fastmcp import FastMCP
     print("✓ FastMCP imported successfully")
 
-    print()
-    print("=" * 80)
-    print("✓ All imports successful!")
-    print("=" * 80)
-    print()
-    print("The FastMCP server can be started with:")
-    print("  ./venv/bin/python run.py")
-    print()
+    lines = [
+        "",
+        SEPARATOR,
+        "✓ All imports successful!",
+        SEPARATOR,
+        "",
+        "The FastMCP server can be started with:",
+        "  ./venv/bin/python run.py",
+        "",
+    ]
+    write_lines(lines)
+    sys.stdout.flush()
 
 except Exception as e:
     print(f"Error: {e}")
-    import traceback
-    traceback.print_exc()
+    traceback.print_exception(type(e), e, e.__traceback__, limit=5)
@@ -7,34 +7,43 @@ FastMCP의 테스트 클라이언트를 사용하여 서버가 정상 작동하
 
 import asyncio
 import sys
+import traceback
 from pathlib import Path
 
+from _harness import run, write_lines
+
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
+from llms_parser import get_default_parser
 from server import mcp
 
+SEPARATOR = "=" * 80
+
 
 async def test_server():
     """Test MCP server components."""
-    print("=" * 80)
-    print("MCP Server - Local Test")
-    print("=" * 80)
-    print()
-
     # Test 1: Server metadata
-    print("1. Server Metadata")
-    print(f"   Name: {mcp.name}")
-    print()
+    write_lines(
+        [
+            SEPARATOR,
+            "MCP Server - Local Test",
+            SEPARATOR,
+            "",
+            "1. Server Metadata",
+            f"   Name: {mcp.name}",
+            "",
+        ]
+    )
 
     # Test 2: List resources
     print("2. Testing Resources")
     try:
         # FastMCP servers expose resources through _resources
-        resource_count = len(mcp._resources)
-        print(f"   ✓ Found {resource_count} resources")
-        for uri, func in mcp._resources.items():
-            print(f"     - {uri}")
-        print()
+        lines = [f"   ✓ Found {len(mcp._resources)} resources"]
+        for uri in mcp._resources:
+            lines.append(f"     - {uri}")
+        lines.append("")
+        write_lines(lines)
     except Exception as e:
         print(f"   ✗ Error listing resources: {e}")
         print()
@@ -42,11 +51,11 @@ async def test_server():
     # Test 3: List tools
     print("3. Testing Tools")
     try:
-        tool_count = len(mcp._tools)
-        print(f"   ✓ Found {tool_count} tools")
-        for name, func in mcp._tools.items():
-            print(f"     - {name}()")
-        print()
+        lines = [f"   ✓ Found {len(mcp._tools)} tools"]
+        for name in mcp._tools:
+            lines.append(f"     - {name}()")
+        lines.append("")
+        write_lines(lines)
     except Exception as e:
         print(f"   ✗ Error listing tools: {e}")
         print()
@@ -54,57 +63,70 @@ async def test_server():
     # Test 4: List prompts
     print("4. Testing Prompts")
     try:
-        prompt_count = len(mcp._prompts)
-        print(f"   ✓ Found {prompt_count} prompts")
-        for name, func in mcp._prompts.items():
-            print(f"     - {name}")
-        print()
+        lines = [f"   ✓ Found {len(mcp._prompts)} prompts"]
+        for name in mcp._prompts:
+            lines.append(f"     - {name}")
+        lines.append("")
+        write_lines(lines)
     except Exception as e:
         print(f"   ✗ Error listing prompts: {e}")
         print()
 
+    # Tests 5 and 6 use the server's parser; the search starts now and joins the same fetch
+    parser = get_default_parser()
+    search_task = asyncio.create_task(parser.search_documentation("git"))
+
     # Test 5: Test a resource
     print("5. Testing Resource Access (blog://llms-txt)")
     try:
-        from llms_parser import LLMSParser
-        parser = LLMSParser()
+        # One request, shared with the search; the raw text then comes from the cache
         content = await parser.get_content()
-        print(f"   ✓ Successfully fetched content ({len(content.raw_content)} chars)")
-        print(f"   ✓ Documentation sections: {len(content.documentation)}")
-        print(f"   ✓ Tech Blog sections: {len(content.tech_blog)}")
-        print()
+        raw_content = await parser.get_source_text()
+        write_lines(
+            [
+                f"   ✓ Successfully fetched content ({len(raw_content)} chars)",
+                f"   ✓ Documentation sections: {len(content.documentation)}",
+                f"   ✓ Tech Blog sections: {len(content.tech_blog)}",
+                "",
+            ]
+        )
     except Exception as e:
         print(f"   ✗ Error accessing resource: {e}")
-        import traceback
-        traceback.print_exc()
+        traceback.print_exception(type(e), e, e.__traceback__, limit=5)
         print()
 
     # Test 6: Test a tool
     print("6. Testing Tool (search_documentation)")
     try:
-        from llms_parser import LLMSParser
-        parser = LLMSParser()
-        results = await parser.search_documentation("git")
-        print(f"   ✓ Search returned {len(results)} results")
+        results = await search_task
+        lines = [f"   ✓ Search returned {len(results)} results"]
         if results:
-            print(f"   ✓ First result: {results[0].title}")
-        print()
+            lines.append(f"   ✓ First result: {results[0].title}")
+        lines.append("")
+        write_lines(lines)
     except Exception as e:
         print(f"   ✗ Error testing tool: {e}")
-        import traceback
-        traceback.print_exc()
+        traceback.print_exception(type(e), e, e.__traceback__, limit=5)
         print()
 
-    print("=" * 80)
-    print("✓ Local test completed!")
-    print("=" * 80)
-    print()
-    print("Next steps:")
-    print("1. Start the server: ./venv/bin/python run.py")
-    print("2. Use MCP Inspector: npx @modelcontextprotocol/inspector")
-    print("3. Or configure Claude Desktop with the server")
-    print()
+    # Release the shared parser's connection pool (it reconnects if used again)
+    await parser.aclose()
+
+    write_lines(
+        [
+            SEPARATOR,
+            "✓ Local test completed!",
+            SEPARATOR,
+            "",
+            "Next steps:",
+            "1. Start the server: ./venv/bin/python run.py",
+            "2. Use MCP Inspector: npx @modelcontextprotocol/inspector",
+            "3. Or configure Claude Desktop with the server",
+            "",
+        ]
+    )
+    sys.stdout.flush()
 
 
 if __name__ == "__main__":
-    asyncio.run(test_server())
+    run(test_server())